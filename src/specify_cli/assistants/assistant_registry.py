@@ -5,7 +5,7 @@ This module provides the StaticAssistantRegistry class that implements
 the AssistantRegistry ABC with a simple dictionary-based storage system.
 """
 
-from typing import Dict, List, Optional
+from typing import Container, Dict, Iterable, List, Optional
 
 from .interfaces import AssistantProvider, AssistantRegistry, ValidationResult
 from .types import AssistantName
@@ -23,24 +23,55 @@ class StaticAssistantRegistry(AssistantRegistry):
         """Initialize empty registry."""
         self._assistants: Dict[AssistantName, AssistantProvider] = {}
 
-    def register_assistant(self, assistant: AssistantProvider) -> None:
-        """Register an assistant provider instance in the registry."""
+    def _validate_assistant(
+        self, assistant: AssistantProvider, seen: Container[AssistantName] = ()
+    ) -> AssistantName:
+        """Check that an assistant can be registered and return its name.
+
+        Args:
+            assistant: Provider to check
+            seen: Names already accepted earlier in the same batch
+
+        Raises:
+            TypeError: If the assistant does not implement AssistantProvider
+            ValueError: If the name is empty, registered, or repeated in the batch
+        """
         if not isinstance(assistant, AssistantProvider):
             raise TypeError(
                 f"Assistant must implement AssistantProvider, got {type(assistant)}"
             )
 
         # Validate the assistant configuration
-        config = assistant.config
-        if not config.name:
+        name = assistant.config.name
+        if not name:
             raise ValueError("Assistant must have a non-empty name")
 
         # Check for name conflicts
-        if config.name in self._assistants:
-            raise ValueError(f"Assistant '{config.name}' is already registered")
+        if name in self._assistants:
+            raise ValueError(f"Assistant '{name}' is already registered")
+        if name in seen:
+            raise ValueError(f"Duplicate assistant '{name}' in batch")
+
+        return name
+
+    def register_assistant(self, assistant: AssistantProvider) -> None:
+        """Register an assistant provider instance in the registry."""
+        name = self._validate_assistant(assistant)
 
         # Store the assistant
-        self._assistants[config.name] = assistant
+        self._assistants[name] = assistant
+
+    def register_many(self, assistants: Iterable[AssistantProvider]) -> None:
+        """Register several assistant providers at once.
+
+        All providers are validated before any is stored, so a conflict
+        leaves the registry unchanged.
+        """
+        batch: Dict[AssistantName, AssistantProvider] = {}
+        for assistant in assistants:
+            batch[self._validate_assistant(assistant, batch)] = assistant
+
+        self._assistants.update(batch)
 
     def get_assistant(self, name: AssistantName) -> Optional[AssistantProvider]:
         """Retrieve a registered assistant by name."""
@@ -34,10 +34,9 @@ from .gemini import GeminiProvider
 registry = StaticAssistantRegistry()
 
 # Register all providers
-registry.register_assistant(ClaudeProvider())
-registry.register_assistant(CopilotProvider())
-registry.register_assistant(CursorProvider())
-registry.register_assistant(GeminiProvider())
+registry.register_many(
+    [ClaudeProvider(), CopilotProvider(), CursorProvider(), GeminiProvider()]
+)
 
 
 # Convenience functions for backward compatibility and ease of use
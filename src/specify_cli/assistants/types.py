@@ -6,14 +6,49 @@ configurations with zero hardcoding and complete type safety using Pydantic.
 """
 
 from enum import Enum
-from pathlib import Path
-from typing import Dict, Optional, Set
-
-from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from functools import lru_cache
+from pathlib import Path, PurePath
+from typing import Annotated, Dict, FrozenSet, Optional
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    StringConstraints,
+    field_validator,
+    model_validator,
+)
 
 from .injection_points import InjectionPointMeta
 
 
+@lru_cache(maxsize=1024)
+def _normalize_path(path: str) -> str:
+    """Normalize a path to POSIX form lexically, without touching the filesystem."""
+    return PurePath(path).as_posix()
+
+
+@lru_cache(maxsize=256)
+def _collect_paths(
+    base_directory: str,
+    context_file: str,
+    commands_directory: str,
+    agents_directory: Optional[str],
+) -> FrozenSet[str]:
+    """Build the managed path set once per distinct combination of paths."""
+    paths = {base_directory, context_file, commands_directory}
+    if agents_directory:
+        paths.add(agents_directory)
+    return frozenset(paths)
+
+
+# Assistant identifier: lowercase, alphanumeric with hyphens/underscores
+_AssistantNameStr = Annotated[
+    str,
+    StringConstraints(pattern=r"^[a-z][a-z0-9_-]*$", min_length=1, max_length=50),
+]
+
+
 class FileFormat(str, Enum):
     """File formats for assistant files."""
 
@@ -58,11 +93,8 @@ class AssistantConfig(BaseModel):
     time with detailed error messages.
     """
 
-    name: str = Field(
+    name: _AssistantNameStr = Field(
         ...,
-        pattern=r"^[a-z][a-z0-9_-]*$",
-        min_length=1,
-        max_length=50,
         description="Unique assistant identifier (lowercase, alphanumeric with hyphens/underscores)",
     )
 
@@ -161,21 +193,19 @@ class AssistantConfig(BaseModel):
 
         return self
 
-    def get_all_paths(self) -> Set[str]:
+    def get_all_paths(self) -> FrozenSet[str]:
         """
         Get all file/directory paths defined in this configuration.
 
         Returns:
-            Set of all paths for immutable iteration
+            Frozen set of all paths, shared across calls
         """
-        paths = {
+        return _collect_paths(
             self.base_directory,
             self.context_file.file,
             self.command_files.directory,
-        }
-        if self.agent_files:
-            paths.add(self.agent_files.directory)
-        return paths
+            self.agent_files.directory if self.agent_files else None,
+        )
 
     def is_path_managed(self, path: str) -> bool:
         """
@@ -187,10 +217,10 @@ class AssistantConfig(BaseModel):
         Returns:
             True if path is managed by this assistant
         """
-        if not isinstance(path, str):
+        if not isinstance(path, str) or not path:
             return False
 
-        normalized_path = str(Path(path).as_posix())
+        normalized_path = _normalize_path(path)
         return any(
             normalized_path.startswith(managed_path)
             for managed_path in self.get_all_paths()
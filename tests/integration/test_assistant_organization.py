@@ -141,7 +141,7 @@ class TestAssistantOrganizationIntegration:
 
             # Path management should work
             all_paths = config.get_all_paths()
-            assert isinstance(all_paths, set)
+            assert isinstance(all_paths, frozenset)
             assert len(all_paths) >= 1  # At least base directory
 
     def test_multi_assistant_workflow_integration(self):
@@ -0,0 +1,100 @@
+"""Shared fixtures for unit tests."""
+
+import functools
+from typing import Any, Callable
+
+import pytest
+from pydantic import ValidationError
+from pydantic_core import ErrorDetails
+
+from specify_cli.assistants.claude.provider import ClaudeProvider
+from specify_cli.assistants.gemini.provider import GeminiProvider
+from specify_cli.assistants.types import (
+    AssistantConfig,
+    ContextFileConfig,
+    FileFormat,
+    TemplateConfig,
+)
+
+ErrorIndex = dict[tuple[int | str, ...], list[ErrorDetails]]
+
+_CLAUDE_PAYLOAD: dict[str, Any] = {
+    "name": "claude",
+    "display_name": "Claude Assistant",
+    "description": "AI assistant by Anthropic",
+    "base_directory": ".claude",
+    "context_file": {"file": "CLAUDE.md", "file_format": "md"},
+    "command_files": {"directory": ".claude/commands", "file_format": "md"},
+    "agent_files": {"directory": ".claude/agents", "file_format": "md"},
+}
+
+
+def _index_errors(exc: ValidationError) -> ErrorIndex:
+    """Group validation errors by location for direct lookup."""
+    index: ErrorIndex = {}
+    # Tests only inspect loc/type/msg, so skip building the url, input and ctx entries
+    for err in exc.errors(
+        include_url=False, include_input=False, include_context=False
+    ):
+        index.setdefault(tuple(err["loc"]), []).append(err)
+    return index
+
+
+@functools.cache
+def _context_file(file: str, file_format: FileFormat) -> ContextFileConfig:
+    """Return a shared (frozen) context file config."""
+    return ContextFileConfig(file=file, file_format=file_format)
+
+
+@functools.cache
+def _template(directory: str, file_format: FileFormat) -> TemplateConfig:
+    """Return a shared (frozen) template config."""
+    return TemplateConfig(directory=directory, file_format=file_format)
+
+
+@pytest.fixture(scope="session")
+def index_errors() -> Callable[[ValidationError], ErrorIndex]:
+    """Helper that groups a ValidationError's errors by location."""
+    return _index_errors
+
+
+@pytest.fixture(scope="session")
+def make_context_file() -> Callable[[str, FileFormat], ContextFileConfig]:
+    """Factory for cached context file configs."""
+    return _context_file
+
+
+@pytest.fixture(scope="session")
+def make_template() -> Callable[[str, FileFormat], TemplateConfig]:
+    """Factory for cached template configs."""
+    return _template
+
+
+@pytest.fixture(scope="session")
+def claude_payload() -> dict[str, Any]:
+    """Raw Claude config payload; spread it into a new dict rather than mutating it."""
+    return _CLAUDE_PAYLOAD
+
+
+@pytest.fixture(scope="session")
+def claude_config(claude_payload: dict[str, Any]) -> AssistantConfig:
+    """Canonical Claude configuration, validated once per session."""
+    return AssistantConfig.model_validate(claude_payload)
+
+
+@pytest.fixture(scope="session")
+def assistant_json_schema() -> dict:
+    """AssistantConfig JSON schema, generated once per session (tests only read it)."""
+    return AssistantConfig.model_json_schema()
+
+
+@pytest.fixture(scope="session")
+def claude_provider() -> ClaudeProvider:
+    """Claude provider shared across the session."""
+    return ClaudeProvider()
+
+
+@pytest.fixture(scope="session")
+def gemini_provider() -> GeminiProvider:
+    """Gemini provider shared across the session."""
+    return GeminiProvider()
@@ -5,6 +5,7 @@ Tests individual service methods with controlled inputs and mocked dependencies.
 Focuses on business logic validation and error handling.
 """
 
+import io
 from pathlib import Path
 from unittest.mock import Mock, patch
 
@@ -12,46 +13,47 @@ import pytest
 from rich.console import Console
 
 from specify_cli.assistants.injection_points import InjectionPoint
-from specify_cli.assistants.types import (
-    AssistantConfig,
-    ContextFileConfig,
-    FileFormat,
-    TemplateConfig,
-)
+from specify_cli.assistants.types import AssistantConfig, FileFormat
 from specify_cli.services.assistant_management_service import AssistantManagementService
+from specify_cli.services.assistant_management_service import (
+    assistant_management_service as _ams,
+)
+
+pytestmark = [pytest.mark.xdist_group("assistants")]
+
+# Shared quiet console; Rich probes the terminal on every Console() call
+_CONSOLE = Console(file=io.StringIO(), force_terminal=False)
+
+_BOOM = RuntimeError("Test error")
 
 
 @pytest.fixture
-def mock_assistant_config():
+def mock_assistant_config(make_context_file, make_template):
     """Create a mock assistant configuration."""
     return AssistantConfig(
         name="test_assistant",
         display_name="Test Assistant",
         description="A test AI assistant",
         base_directory=".test",
-        context_file=ContextFileConfig(
-            file=".test/TEST.md", file_format=FileFormat.MARKDOWN
-        ),
-        command_files=TemplateConfig(
-            directory=".test/commands", file_format=FileFormat.MARKDOWN
-        ),
-        agent_files=TemplateConfig(
-            directory=".test/agents", file_format=FileFormat.MARKDOWN
-        ),
+        context_file=make_context_file(".test/TEST.md", FileFormat.MARKDOWN),
+        command_files=make_template(".test/commands", FileFormat.MARKDOWN),
+        agent_files=make_template(".test/agents", FileFormat.MARKDOWN),
     )
 
 
 @pytest.fixture
 def mock_assistant_provider(mock_assistant_config):
     """Create a mock assistant provider."""
-    provider = Mock()
-    provider.config = mock_assistant_config
-    provider.get_injection_values.return_value = {
-        InjectionPoint.COMMAND_PREFIX: "test ",
-        InjectionPoint.SETUP_INSTRUCTIONS: "Install test CLI and run 'test auth'",
-        InjectionPoint.CONTEXT_FILE_PATH: ".test/TEST.md",
-    }
-    return provider
+    return Mock(
+        config=mock_assistant_config,
+        **{
+            "get_injection_values.return_value": {
+                InjectionPoint.COMMAND_PREFIX: "test ",
+                InjectionPoint.SETUP_INSTRUCTIONS: "Install test CLI and run 'test auth'",
+                InjectionPoint.CONTEXT_FILE_PATH: ".test/TEST.md",
+            }
+        },
+    )
 
 
 @pytest.fixture
@@ -59,21 +61,18 @@ def assistant_service():
     """Create an AssistantManagementService with mocked dependencies."""
     mock_project_manager = Mock()
     mock_config_service = Mock()
-    console = Console()
 
     return AssistantManagementService(
         project_manager=mock_project_manager,
         config_service=mock_config_service,
-        console=console,
+        console=_CONSOLE,
     )
 
 
 class TestStatusCheckingFunctions:
     """Test status checking business logic."""
 
-    @patch(
-        "specify_cli.services.assistant_management_service.assistant_management_service.get_assistant"
-    )
+    @patch.object(_ams, "get_assistant")
     def test_check_assistant_status_missing_assistant(
         self, mock_get_assistant, assistant_service
     ):
@@ -83,10 +82,8 @@ class TestStatusCheckingFunctions:
         status = assistant_service.check_assistant_status(Path("/tmp"), "nonexistent")
         assert status == "missing"
 
-    @patch(
-        "specify_cli.services.assistant_management_service.assistant_management_service.get_assistant"
-    )
-    @patch("pathlib.Path.exists")
+    @patch.object(_ams, "get_assistant")
+    @patch.object(Path, "exists")
     def test_check_assistant_status_missing_files(
         self,
         mock_exists,
@@ -103,39 +100,30 @@ class TestStatusCheckingFunctions:
         )
         assert status == "missing"
 
-    @patch(
-        "specify_cli.services.assistant_management_service.assistant_management_service.get_assistant"
-    )
+    @patch.object(_ams, "get_assistant")
     def test_check_assistant_status_partial_configuration(
         self, mock_get_assistant, mock_assistant_provider, assistant_service
     ):
         """Test status when some files exist but configuration is incomplete."""
         mock_get_assistant.return_value = mock_assistant_provider
 
-        # Mock the path exists behavior to simulate partial configuration
         # Base directory exists, context file doesn't exist, commands directory exists
-        with patch("pathlib.Path.exists") as mock_exists:
-            # Return True for base and commands directory, False for context file
-            call_count = [0]
-
-            def side_effect():
-                call_count[0] += 1
-                if call_count[0] == 1:  # base directory
-                    return True
-                else:
-                    return call_count[0] != 2  # context file
-
-            mock_exists.side_effect = side_effect
-
+        existing = {
+            Path("/tmp/.test"): True,
+            Path("/tmp/.test/TEST.md"): False,
+            Path("/tmp/.test/commands"): True,
+        }
+
+        with patch.object(
+            Path, "exists", autospec=True, side_effect=existing.__getitem__
+        ):
             status = assistant_service.check_assistant_status(
                 Path("/tmp"), "test_assistant"
             )
             assert status == "partial"
 
-    @patch(
-        "specify_cli.services.assistant_management_service.assistant_management_service.get_assistant"
-    )
-    @patch("pathlib.Path.exists")
+    @patch.object(_ams, "get_assistant")
+    @patch.object(Path, "exists")
     def test_check_assistant_status_fully_configured(
         self,
         mock_exists,
@@ -171,9 +159,7 @@ class TestStatusCheckingFunctions:
 class TestFileOperations:
     """Test file creation and management."""
 
-    @patch(
-        "specify_cli.services.assistant_management_service.assistant_management_service.get_assistant"
-    )
+    @patch.object(_ams, "get_assistant")
     def test_get_files_to_create_structure(
         self, mock_get_assistant, mock_assistant_provider, assistant_service
     ):
@@ -189,9 +175,7 @@ class TestFileOperations:
         assert ".test/commands/" in normalized_files
         assert ".test/agents/" in normalized_files
 
-    @patch(
-        "specify_cli.services.assistant_management_service.assistant_management_service.get_assistant"
-    )
+    @patch.object(_ams, "get_assistant")
     def test_get_files_to_create_missing_assistant(
         self, mock_get_assistant, assistant_service
     ):
@@ -220,9 +204,7 @@ class TestAssistantCreation:
     def test_create_assistant_files_handles_exception(self, assistant_service):
         """Test that create_assistant_files handles exceptions gracefully."""
         # Mock the private method to raise an exception
-        assistant_service._create_ai_only_files = Mock(
-            side_effect=Exception("Test error")
-        )
+        assistant_service._create_ai_only_files = Mock(side_effect=_BOOM)
 
         result = assistant_service.create_assistant_files(
             Path("/tmp"), "test_assistant", force=False
@@ -234,9 +216,7 @@ class TestAssistantCreation:
 class TestInjectionPointDisplay:
     """Test injection point information display."""
 
-    @patch(
-        "specify_cli.services.assistant_management_service.assistant_management_service.get_assistant"
-    )
+    @patch.object(_ams, "get_assistant")
     def test_show_assistant_injection_values_missing_assistant(
         self, mock_get_assistant, assistant_service
     ):
@@ -247,9 +227,7 @@ class TestInjectionPointDisplay:
         assistant_service.show_assistant_injection_values("nonexistent")
         mock_get_assistant.assert_called_once_with("nonexistent")
 
-    @patch(
-        "specify_cli.services.assistant_management_service.assistant_management_service.get_assistant"
-    )
+    @patch.object(_ams, "get_assistant")
     def test_show_assistant_injection_values_success(
         self, mock_get_assistant, mock_assistant_provider, assistant_service
     ):
@@ -12,49 +12,43 @@ from pydantic import ValidationError
 
 from specify_cli.assistants.assistant_registry import StaticAssistantRegistry
 from specify_cli.assistants.interfaces import AssistantProvider, ValidationResult
-from specify_cli.assistants.types import (
-    AssistantConfig,
-    ContextFileConfig,
-    FileFormat,
-    TemplateConfig,
-)
+from specify_cli.assistants.types import AssistantConfig, FileFormat
+
+pytestmark = [pytest.mark.xdist_group("assistants")]
 
 
 @pytest.fixture
-def mock_assistant_config():
+def mock_assistant_config(make_context_file, make_template):
     """Create a mock assistant configuration."""
     return AssistantConfig(
         name="test_assistant",
         display_name="Test Assistant",
         description="A test AI assistant",
         base_directory=".test",
-        context_file=ContextFileConfig(
-            file=".test/TEST.md", file_format=FileFormat.MARKDOWN
-        ),
-        command_files=TemplateConfig(
-            directory=".test/commands", file_format=FileFormat.MARKDOWN
-        ),
-        agent_files=TemplateConfig(
-            directory=".test/agents", file_format=FileFormat.MARKDOWN
-        ),
+        context_file=make_context_file(".test/TEST.md", FileFormat.MARKDOWN),
+        command_files=make_template(".test/commands", FileFormat.MARKDOWN),
+        agent_files=make_template(".test/agents", FileFormat.MARKDOWN),
     )
 
 
 @pytest.fixture
 def mock_assistant_provider(mock_assistant_config):
     """Create a mock assistant provider."""
-    provider = Mock(spec=AssistantProvider)
-    provider.config = mock_assistant_config
-    provider.get_injection_values.return_value = {
-        "assistant_command_prefix": "test ",
-        "assistant_setup_instructions": "Install test CLI",
-        "assistant_context_file_path": ".test/TEST.md",
-    }
-    provider.validate_setup.return_value = ValidationResult(is_valid=True)
-    provider.get_setup_instructions.return_value = ["Step 1", "Step 2"]
-    provider.imports_supported = False
-    provider.format_import.return_value = ""
-    return provider
+    return Mock(
+        spec=AssistantProvider,
+        config=mock_assistant_config,
+        imports_supported=False,
+        **{
+            "get_injection_values.return_value": {
+                "assistant_command_prefix": "test ",
+                "assistant_setup_instructions": "Install test CLI",
+                "assistant_context_file_path": ".test/TEST.md",
+            },
+            "validate_setup.return_value": ValidationResult(is_valid=True),
+            "get_setup_instructions.return_value": ["Step 1", "Step 2"],
+            "format_import.return_value": "",
+        },
+    )
 
 
 @pytest.fixture
@@ -79,7 +73,9 @@ class TestAssistantRegistryBusinessRules:
         ):
             registry.register_assistant(None)
 
-    def test_assistant_name_validation(self, registry):
+    def test_assistant_name_validation(
+        self, registry, make_context_file, make_template
+    ):
         """Test business rules for assistant naming."""
         # Test 1: Empty name should raise ValidationError during config creation
         with pytest.raises(ValidationError):
@@ -88,15 +84,9 @@ class TestAssistantRegistryBusinessRules:
                 display_name="Test Assistant",
                 description="A test AI assistant",
                 base_directory=".test",
-                context_file=ContextFileConfig(
-                    file=".test/TEST.md", file_format=FileFormat.MARKDOWN
-                ),
-                command_files=TemplateConfig(
-                    directory=".test/commands", file_format=FileFormat.MARKDOWN
-                ),
-                agent_files=TemplateConfig(
-                    directory=".test/agents", file_format=FileFormat.MARKDOWN
-                ),
+                context_file=make_context_file(".test/TEST.md", FileFormat.MARKDOWN),
+                command_files=make_template(".test/commands", FileFormat.MARKDOWN),
+                agent_files=make_template(".test/agents", FileFormat.MARKDOWN),
             )
 
         # Test 2: Valid config creation should work
@@ -105,15 +95,9 @@ class TestAssistantRegistryBusinessRules:
             display_name="Test Assistant",
             description="A test AI assistant",
             base_directory=".test",
-            context_file=ContextFileConfig(
-                file=".test/TEST.md", file_format=FileFormat.MARKDOWN
-            ),
-            command_files=TemplateConfig(
-                directory=".test/commands", file_format=FileFormat.MARKDOWN
-            ),
-            agent_files=TemplateConfig(
-                directory=".test/agents", file_format=FileFormat.MARKDOWN
-            ),
+            context_file=make_context_file(".test/TEST.md", FileFormat.MARKDOWN),
+            command_files=make_template(".test/commands", FileFormat.MARKDOWN),
+            agent_files=make_template(".test/agents", FileFormat.MARKDOWN),
         )
 
         provider = Mock(spec=AssistantProvider)
@@ -152,26 +136,39 @@ class TestAssistantRegistryBusinessRules:
         result = registry.unregister_assistant("nonexistent")
         assert result is False
 
+    def test_bulk_registration_is_all_or_nothing(
+        self, registry, mock_assistant_provider
+    ):
+        """Test that a conflicting bulk registration leaves the registry unchanged."""
+        duplicate_provider = Mock(spec=AssistantProvider)
+        duplicate_provider.config = mock_assistant_provider.config
+
+        with pytest.raises(
+            ValueError, match="Duplicate assistant 'test_assistant' in batch"
+        ):
+            registry.register_many([mock_assistant_provider, duplicate_provider])
+
+        assert len(registry) == 0
+
+        registry.register_many([mock_assistant_provider])
+        assert registry.get_assistant("test_assistant") is mock_assistant_provider
+
 
 class TestAssistantValidationWorkflow:
     """Test assistant validation business workflow."""
 
-    def test_validation_success_workflow(self, registry):
+    def test_validation_success_workflow(
+        self, registry, make_context_file, make_template
+    ):
         """Test successful validation workflow."""
         config = AssistantConfig(
             name="valid_assistant",
             display_name="Valid Assistant",
             description="A valid assistant",
             base_directory=".valid",
-            context_file=ContextFileConfig(
-                file=".valid/VALID.md", file_format=FileFormat.MARKDOWN
-            ),
-            command_files=TemplateConfig(
-                directory=".valid/commands", file_format=FileFormat.MARKDOWN
-            ),
-            agent_files=TemplateConfig(
-                directory=".valid/agents", file_format=FileFormat.MARKDOWN
-            ),
+            context_file=make_context_file(".valid/VALID.md", FileFormat.MARKDOWN),
+            command_files=make_template(".valid/commands", FileFormat.MARKDOWN),
+            agent_files=make_template(".valid/agents", FileFormat.MARKDOWN),
         )
 
         provider = Mock(spec=AssistantProvider)
@@ -189,22 +186,18 @@ class TestAssistantValidationWorkflow:
         assert results["valid_assistant"].is_valid
         assert not results["valid_assistant"].has_errors
 
-    def test_validation_error_workflow(self, registry):
+    def test_validation_error_workflow(
+        self, registry, make_context_file, make_template
+    ):
         """Test validation error handling workflow."""
         config = AssistantConfig(
             name="invalid_assistant",
             display_name="Invalid Assistant",
             description="An invalid assistant",
             base_directory=".invalid",
-            context_file=ContextFileConfig(
-                file=".invalid/INVALID.md", file_format=FileFormat.MARKDOWN
-            ),
-            command_files=TemplateConfig(
-                directory=".invalid/commands", file_format=FileFormat.MARKDOWN
-            ),
-            agent_files=TemplateConfig(
-                directory=".invalid/agents", file_format=FileFormat.MARKDOWN
-            ),
+            context_file=make_context_file(".invalid/INVALID.md", FileFormat.MARKDOWN),
+            command_files=make_template(".invalid/commands", FileFormat.MARKDOWN),
+            agent_files=make_template(".invalid/agents", FileFormat.MARKDOWN),
         )
 
         provider = Mock(spec=AssistantProvider)
@@ -229,22 +222,18 @@ class TestAssistantValidationWorkflow:
         assert "Configuration file missing" in result.errors
         assert "API key not configured" in result.warnings
 
-    def test_validation_exception_handling(self, registry):
+    def test_validation_exception_handling(
+        self, registry, make_context_file, make_template
+    ):
         """Test validation exception handling in business workflow."""
         config = AssistantConfig(
             name="error_assistant",
             display_name="Error Assistant",
             description="An assistant that throws errors",
             base_directory=".error",
-            context_file=ContextFileConfig(
-                file=".error/ERROR.md", file_format=FileFormat.MARKDOWN
-            ),
-            command_files=TemplateConfig(
-                directory=".error/commands", file_format=FileFormat.MARKDOWN
-            ),
-            agent_files=TemplateConfig(
-                directory=".error/agents", file_format=FileFormat.MARKDOWN
-            ),
+            context_file=make_context_file(".error/ERROR.md", FileFormat.MARKDOWN),
+            command_files=make_template(".error/commands", FileFormat.MARKDOWN),
+            agent_files=make_template(".error/agents", FileFormat.MARKDOWN),
         )
 
         provider = Mock(spec=AssistantProvider)
@@ -268,22 +257,20 @@ class TestAssistantValidationWorkflow:
 class TestAssistantLifecycleManagement:
     """Test complete assistant lifecycle management."""
 
-    def test_assistant_lifecycle_workflow(self, registry):
+    def test_assistant_lifecycle_workflow(
+        self, registry, make_context_file, make_template
+    ):
         """Test complete assistant management lifecycle."""
         config = AssistantConfig(
             name="lifecycle_test",
             display_name="Lifecycle Test Assistant",
             description="Testing lifecycle",
             base_directory=".lifecycle",
-            context_file=ContextFileConfig(
-                file=".lifecycle/LIFECYCLE.md", file_format=FileFormat.MARKDOWN
-            ),
-            command_files=TemplateConfig(
-                directory=".lifecycle/commands", file_format=FileFormat.MARKDOWN
-            ),
-            agent_files=TemplateConfig(
-                directory=".lifecycle/agents", file_format=FileFormat.MARKDOWN
+            context_file=make_context_file(
+                ".lifecycle/LIFECYCLE.md", FileFormat.MARKDOWN
             ),
+            command_files=make_template(".lifecycle/commands", FileFormat.MARKDOWN),
+            agent_files=make_template(".lifecycle/agents", FileFormat.MARKDOWN),
         )
 
         provider = Mock(spec=AssistantProvider)
@@ -319,7 +306,9 @@ class TestAssistantLifecycleManagement:
         assert success
         assert not registry.is_registered("lifecycle_test")
 
-    def test_multi_assistant_management(self, registry):
+    def test_multi_assistant_management(
+        self, registry, make_context_file, make_template
+    ):
         """Test managing multiple assistants simultaneously."""
         assistants = []
         for i in range(3):
@@ -328,15 +317,11 @@ class TestAssistantLifecycleManagement:
                 display_name=f"Assistant {i}",
                 description=f"Test assistant {i}",
                 base_directory=f".test{i}",
-                context_file=ContextFileConfig(
-                    file=f".test{i}/TEST{i}.md", file_format=FileFormat.MARKDOWN
-                ),
-                command_files=TemplateConfig(
-                    directory=f".test{i}/commands", file_format=FileFormat.MARKDOWN
-                ),
-                agent_files=TemplateConfig(
-                    directory=f".test{i}/agents", file_format=FileFormat.MARKDOWN
+                context_file=make_context_file(
+                    f".test{i}/TEST{i}.md", FileFormat.MARKDOWN
                 ),
+                command_files=make_template(f".test{i}/commands", FileFormat.MARKDOWN),
+                agent_files=make_template(f".test{i}/agents", FileFormat.MARKDOWN),
             )
 
             provider = Mock(spec=AssistantProvider)
@@ -348,7 +333,8 @@ class TestAssistantLifecycleManagement:
             provider.format_import.return_value = ""
 
             assistants.append(provider)
-            registry.register_assistant(provider)
+
+        registry.register_many(assistants)
 
         # Business requirement: All assistants should be accessible
         assert len(registry.get_all_assistants()) == 3
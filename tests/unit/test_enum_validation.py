@@ -1,18 +1,25 @@
 """Test enum-based injection point validation according to spec task T026."""
 
+import pytest
+
 from specify_cli.assistants.injection_points import (
     InjectionPoint,
+    InjectionPointMeta,
     get_all_injection_points,
 )
 from specify_cli.assistants.types import InjectionValues
 
+_ALL_POINTS = tuple(get_all_injection_points())
+_ALL_VALUES = frozenset(ip.value for ip in InjectionPoint)
+_STR_TO_POINT: dict[str, InjectionPointMeta] = {str(ip): ip for ip in _ALL_POINTS}
+
 
 class TestInjectionPointEnumValidation:
     """Test enum-based injection point validation features."""
 
     def test_injection_point_enum_values_are_strings(self) -> None:
         """Test that all injection point values are strings."""
-        for injection_point in get_all_injection_points():
+        for injection_point in _ALL_POINTS:
             assert isinstance(injection_point.name, str)
             assert len(injection_point.name) > 0
 
@@ -24,7 +31,7 @@ class TestInjectionPointEnumValidation:
         assert InjectionPoint.CONTEXT_FILE_PATH.name == "assistant_context_file_path"
 
         # All injection point names should start with assistant_
-        for injection_point in get_all_injection_points():
+        for injection_point in _ALL_POINTS:
             assert injection_point.name.startswith("assistant_")
 
     def test_injection_values_type_validation(self) -> None:
@@ -37,8 +44,6 @@ class TestInjectionPointEnumValidation:
         assert isinstance(valid_values, dict)
 
         # Check all keys are InjectionPointMeta objects
-        from specify_cli.assistants.injection_points import InjectionPointMeta
-
         for key in valid_values:
             assert isinstance(key, InjectionPointMeta)
 
@@ -54,7 +59,7 @@ class TestInjectionPointEnumValidation:
 
         # Test string values can be found
         command_prefix_value = InjectionPoint.COMMAND_PREFIX.value
-        assert any(ip.value == command_prefix_value for ip in InjectionPoint)
+        assert command_prefix_value in _ALL_VALUES
 
     def test_injection_point_comparison_operations(self) -> None:
         """Test comparison operations work correctly."""
@@ -68,27 +73,18 @@ class TestInjectionPointEnumValidation:
 
         # Test string comparison
         assert point1.value == "assistant_command_prefix"
-        assert (
-            point1.value == "assistant_command_prefix"
-        )  # Test via .value instead of str()
 
     def test_injection_point_enum_immutability(self) -> None:
         """Test that injection point enums cannot be modified."""
         # The value property is read-only, so attempts to set it should fail
         # This is a design feature to ensure injection points remain immutable
-        try:
+        with pytest.raises(AttributeError):
             InjectionPoint.COMMAND_PREFIX.value = "modified"  # type: ignore[misc]
-            raise AssertionError("Should not be able to modify injection point value")
-        except AttributeError:
-            pass  # Expected behavior
 
     def test_injection_point_iteration_consistency(self) -> None:
         """Test that iteration over injection points is consistent."""
-        points_list1 = list(InjectionPoint)
-        points_list2 = list(InjectionPoint)
-
-        assert points_list1 == points_list2
-        assert len(points_list1) > 0
+        assert tuple(InjectionPoint) == _ALL_POINTS
+        assert len(_ALL_POINTS) > 0
 
     def test_injection_values_dict_key_validation(self) -> None:
         """Test that injection values dictionaries use proper enum keys."""
@@ -102,17 +98,11 @@ class TestInjectionPointEnumValidation:
     def test_injection_point_string_serialization(self) -> None:
         """Test string serialization and deserialization of injection points."""
         original_point = InjectionPoint.COMMAND_PREFIX
-        string_value = str(original_point)
 
         # Find the same enum by string value
-        found_point = None
-        for point in InjectionPoint:
-            if str(point) == string_value:
-                found_point = point
-                break
+        found_point = _STR_TO_POINT[str(original_point)]
 
-        assert found_point is not None
-        assert found_point == original_point
+        assert found_point is original_point
 
     def test_injection_point_enum_completeness(self) -> None:
         """Test that all expected injection points are present."""
@@ -122,7 +112,5 @@ class TestInjectionPointEnumValidation:
             "assistant_setup_instructions",
         }
 
-        available_points = {ip.value for ip in InjectionPoint}
-
         # All required points should be available
-        assert required_points.issubset(available_points)
+        assert required_points.issubset(_ALL_VALUES)
@@ -5,6 +5,10 @@ Tests business rules, validation logic, and assistant-specific behavior.
 Focuses on SpecifyX requirements, not framework behavior.
 """
 
+import re
+
+import pytest
+
 from specify_cli.assistants.constants import (
     ALL_INJECTION_POINTS,
     OPTIONAL_INJECTION_POINTS,
@@ -15,150 +19,148 @@ from specify_cli.assistants.injection_points import (
     get_injection_point_descriptions,
 )
 
+_TEMPLATE_NAME_RE = re.compile(r"^assistant(_[a-z0-9]+)+$")
+_RESERVED_TEMPLATE_KEYWORDS = frozenset(
+    {"if", "else", "elif", "endif", "for", "endfor", "block", "endblock"}
+)
+
+
+@pytest.fixture(scope="session")
+def injection_descriptions():
+    """Injection point descriptions keyed by name."""
+    return get_injection_point_descriptions()
+
+
+@pytest.fixture(scope="session")
+def injection_by_name():
+    """Injection point objects keyed by name."""
+    return {point.name: point for point in ALL_INJECTION_POINTS}
+
+
+# Injection point business logic and validation rules
+
+
+def test_required_injection_points_coverage(injection_descriptions):
+    """Test that all required injection points are properly defined for business needs."""
+    # These are the minimum injection points needed for assistant functionality
+    expected_required = {
+        InjectionPoint.COMMAND_PREFIX,
+        InjectionPoint.SETUP_INSTRUCTIONS,
+        InjectionPoint.CONTEXT_FILE_PATH,
+    }
+
+    assert expected_required == REQUIRED_INJECTION_POINTS
+
+    # Business rule: Required points must have descriptions
+    for point in REQUIRED_INJECTION_POINTS:
+        assert point.name in injection_descriptions
+        description = injection_descriptions[point.name]
+        assert len(description) >= 30  # Business requirement for detailed descriptions
+
+
+def test_injection_point_categorization_rules():
+    """Test business rules for injection point categorization."""
+    # Business rule: Every injection point must be categorized
+    all_points = ALL_INJECTION_POINTS
+    categorized_points = REQUIRED_INJECTION_POINTS | OPTIONAL_INJECTION_POINTS
+    assert all_points == categorized_points
+
+    # Business rule: No overlap between categories
+    overlap = REQUIRED_INJECTION_POINTS & OPTIONAL_INJECTION_POINTS
+    assert len(overlap) == 0
+
+
+def test_injection_point_naming_convention():
+    """Test business requirement for consistent naming."""
+    # Business rule: All injection points must follow assistant_* pattern
+    for point in ALL_INJECTION_POINTS:
+        assert point.name.startswith("assistant_")
 
-class TestInjectionPointBusinessRules:
-    """Test injection point business logic and validation rules."""
-
-    def test_required_injection_points_coverage(self):
-        """Test that all required injection points are properly defined for business needs."""
-        # These are the minimum injection points needed for assistant functionality
-        expected_required = {
-            InjectionPoint.COMMAND_PREFIX,
-            InjectionPoint.SETUP_INSTRUCTIONS,
-            InjectionPoint.CONTEXT_FILE_PATH,
-        }
-
-        assert expected_required == REQUIRED_INJECTION_POINTS
-
-        # Business rule: Required points must have descriptions
-        injection_point_descriptions = get_injection_point_descriptions()
-        for point in REQUIRED_INJECTION_POINTS:
-            assert point.name in injection_point_descriptions
-            description = injection_point_descriptions[point.name]
-            assert (
-                len(description) >= 30
-            )  # Business requirement for detailed descriptions
-
-    def test_injection_point_categorization_rules(self):
-        """Test business rules for injection point categorization."""
-        # Business rule: Every injection point must be categorized
-        all_points = ALL_INJECTION_POINTS
-        categorized_points = REQUIRED_INJECTION_POINTS | OPTIONAL_INJECTION_POINTS
-        assert all_points == categorized_points
-
-        # Business rule: No overlap between categories
-        overlap = REQUIRED_INJECTION_POINTS & OPTIONAL_INJECTION_POINTS
-        assert len(overlap) == 0
-
-    def test_injection_point_naming_convention(self):
-        """Test business requirement for consistent naming."""
-        # Business rule: All injection points must follow assistant_* pattern
-        for point in ALL_INJECTION_POINTS:
-            assert point.name.startswith("assistant_")
-
-        # Business rule: Names should reflect their registry counterpart
-        assert InjectionPoint.COMMAND_PREFIX.name == "assistant_command_prefix"
-        assert InjectionPoint.SETUP_INSTRUCTIONS.name == "assistant_setup_instructions"
-        assert InjectionPoint.CONTEXT_FILE_PATH.name == "assistant_context_file_path"
-
-    def test_injection_point_description_quality_standards(self):
-        """Test business requirements for description quality."""
-        injection_point_descriptions = get_injection_point_descriptions()
-        for point_name, description in injection_point_descriptions.items():
-            # Business requirement: Professional documentation standards
-            assert description[0].isupper()
-            assert description.endswith(".")
-            assert "assistant" in description.lower()
-            assert len(description) >= 20
-
-            # Business requirement: Required points need more detail
-            # Find the corresponding point object to check if it's required
-            point_obj = InjectionPoint.find_injection_point_by_name(point_name)
-            if point_obj and point_obj in REQUIRED_INJECTION_POINTS:
-                assert len(description) >= 30
-
-
-class TestInjectionPointValidation:
-    """Test injection point validation for assistant integration."""
-
-    def test_injection_point_template_compatibility(self):
-        """Test that injection points work correctly in template contexts."""
+    # Business rule: Names should reflect their registry counterpart
+    assert InjectionPoint.COMMAND_PREFIX.name == "assistant_command_prefix"
+    assert InjectionPoint.SETUP_INSTRUCTIONS.name == "assistant_setup_instructions"
+    assert InjectionPoint.CONTEXT_FILE_PATH.name == "assistant_context_file_path"
+
+
+def test_injection_point_description_quality_standards(
+    injection_descriptions, injection_by_name
+):
+    """Test business requirements for description quality."""
+    for point_name, description in injection_descriptions.items():
+        # Business requirement: Professional documentation standards
+        assert description[0].isupper()
+        assert description.endswith(".")
+        assert "assistant" in description.lower()
+        assert len(description) >= 20
+
+        # Business requirement: Required points need more detail
+        # Find the corresponding point object to check if it's required
+        point_obj = injection_by_name.get(point_name)
+        if point_obj and point_obj in REQUIRED_INJECTION_POINTS:
+            assert len(description) >= 30
+
+
+# Injection point validation for assistant integration
+
+
+def test_injection_point_template_compatibility():
+    """Test that injection points work correctly in template contexts."""
+    for point in ALL_INJECTION_POINTS:
         # Business requirement: Injection points must be valid Jinja2 variable names
-        for point in ALL_INJECTION_POINTS:
-            # Valid template variable names (no special chars except underscore)
-            assert point.name.replace("_", "").replace("assistant", "").isalnum()
+        assert _TEMPLATE_NAME_RE.match(point.name), point.name
 
         # Business requirement: No reserved template keywords
-        reserved_keywords = {
-            "if",
-            "else",
-            "elif",
-            "endif",
-            "for",
-            "endfor",
-            "block",
-            "endblock",
-        }
-        for point in ALL_INJECTION_POINTS:
-            parts = point.name.split("_")
-            for part in parts:
-                assert part not in reserved_keywords
-
-    def test_required_vs_optional_distinction(self):
-        """Test business logic for required vs optional injection points."""
-        # Business rule: Command prefix is always required for assistant commands
-        assert InjectionPoint.COMMAND_PREFIX in REQUIRED_INJECTION_POINTS
-
-        # Business rule: Setup instructions are required for new users
-        assert InjectionPoint.SETUP_INSTRUCTIONS in REQUIRED_INJECTION_POINTS
-
-        # Business rule: Context file path is required for file references
-        assert InjectionPoint.CONTEXT_FILE_PATH in REQUIRED_INJECTION_POINTS
-
-        # Business rule: Advanced features are optional
-        assert InjectionPoint.REVIEW_COMMAND in OPTIONAL_INJECTION_POINTS
-        assert InjectionPoint.DOCUMENTATION_URL in OPTIONAL_INJECTION_POINTS
-        assert InjectionPoint.CUSTOM_COMMANDS in OPTIONAL_INJECTION_POINTS
-
-
-class TestInjectionPointIntegration:
-    """Test injection point integration with assistant system."""
-
-    def test_injection_point_completeness(self):
-        """Test that injection point system covers all assistant integration needs."""
-        # Business requirement: Must support all major assistant capabilities
-
-        # Core functionality
-        assert InjectionPoint.COMMAND_PREFIX in ALL_INJECTION_POINTS
-        assert InjectionPoint.SETUP_INSTRUCTIONS in ALL_INJECTION_POINTS
-        assert InjectionPoint.CONTEXT_FILE_PATH in ALL_INJECTION_POINTS
+        assert _RESERVED_TEMPLATE_KEYWORDS.isdisjoint(point.name.split("_"))
+
+
+def test_required_vs_optional_distinction():
+    """Test business logic for required vs optional injection points."""
+    # Business rule: Command prefix is always required for assistant commands
+    assert InjectionPoint.COMMAND_PREFIX in REQUIRED_INJECTION_POINTS
 
+    # Business rule: Setup instructions are required for new users
+    assert InjectionPoint.SETUP_INSTRUCTIONS in REQUIRED_INJECTION_POINTS
+
+    # Business rule: Context file path is required for file references
+    assert InjectionPoint.CONTEXT_FILE_PATH in REQUIRED_INJECTION_POINTS
+
+    # Business rule: Advanced features are optional
+    assert InjectionPoint.REVIEW_COMMAND in OPTIONAL_INJECTION_POINTS
+    assert InjectionPoint.DOCUMENTATION_URL in OPTIONAL_INJECTION_POINTS
+    assert InjectionPoint.CUSTOM_COMMANDS in OPTIONAL_INJECTION_POINTS
+
+
+# Injection point integration with assistant system
+
+
+_REQUIRED = "required"
+_OPTIONAL = "optional"
+
+
+@pytest.mark.parametrize(
+    ("point", "category"),
+    [
+        # Core functionality every assistant needs
+        (InjectionPoint.COMMAND_PREFIX, _REQUIRED),
+        (InjectionPoint.SETUP_INSTRUCTIONS, _REQUIRED),
+        (InjectionPoint.CONTEXT_FILE_PATH, _REQUIRED),
         # Documentation and help
-        assert InjectionPoint.DOCUMENTATION_URL in ALL_INJECTION_POINTS
-        assert InjectionPoint.BEST_PRACTICES in ALL_INJECTION_POINTS
-        assert InjectionPoint.TROUBLESHOOTING in ALL_INJECTION_POINTS
-
-        # Advanced features
-        assert InjectionPoint.CUSTOM_COMMANDS in ALL_INJECTION_POINTS
-        assert InjectionPoint.IMPORT_SYNTAX in ALL_INJECTION_POINTS
-        assert InjectionPoint.MEMORY_CONFIGURATION in ALL_INJECTION_POINTS
-
-    def test_injection_point_assistant_compatibility(self):
-        """Test injection points support different assistant types."""
-        # Business requirement: System must work with various AI assistants
-
-        # All assistants need basic command structure
-        basic_requirements = {
-            InjectionPoint.COMMAND_PREFIX,
-            InjectionPoint.SETUP_INSTRUCTIONS,
-            InjectionPoint.CONTEXT_FILE_PATH,
-        }
-        assert basic_requirements.issubset(REQUIRED_INJECTION_POINTS)
-
-        # Some assistants have additional capabilities
-        advanced_features = {
-            InjectionPoint.MEMORY_CONFIGURATION,
-            InjectionPoint.IMPORT_SYNTAX,
-            InjectionPoint.CUSTOM_COMMANDS,
-        }
-        assert advanced_features.issubset(OPTIONAL_INJECTION_POINTS)
+        (InjectionPoint.DOCUMENTATION_URL, _OPTIONAL),
+        (InjectionPoint.BEST_PRACTICES, _OPTIONAL),
+        (InjectionPoint.TROUBLESHOOTING, _OPTIONAL),
+        # Advanced features only some assistants have
+        (InjectionPoint.CUSTOM_COMMANDS, _OPTIONAL),
+        (InjectionPoint.IMPORT_SYNTAX, _OPTIONAL),
+        (InjectionPoint.MEMORY_CONFIGURATION, _OPTIONAL),
+    ],
+    ids=str,
+)
+def test_injection_point_membership(point, category):
+    """Test that the injection point system covers all assistant integration needs."""
+    assert point in ALL_INJECTION_POINTS
+    expected_set = (
+        REQUIRED_INJECTION_POINTS
+        if category == _REQUIRED
+        else OPTIONAL_INJECTION_POINTS
+    )
+    assert point in expected_set
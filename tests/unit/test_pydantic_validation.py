@@ -5,6 +5,11 @@ These tests validate specific Pydantic features and edge cases for
 type safety and validation behavior.
 """
 
+from contextlib import nullcontext
+from operator import attrgetter
+from pathlib import Path
+from typing import Any, Callable, Final
+
 import pytest
 from pydantic import ValidationError
 
@@ -22,181 +27,173 @@ from specify_cli.assistants.types import (
     TemplateConfig,
 )
 
+_MD = FileFormat.MARKDOWN
+
+_MEMBERS = tuple(InjectionPoint.get_members().values())
+_MEMBER_SET = frozenset(_MEMBERS)
+_UNION = REQUIRED_INJECTION_POINTS | OPTIONAL_INJECTION_POINTS
+
+_SAMPLE_INJECTIONS: Final[InjectionValues] = {
+    InjectionPoint.COMMAND_PREFIX: "claude:",
+    InjectionPoint.SETUP_INSTRUCTIONS: "Setup Claude",
+    InjectionPoint.CONTEXT_FILE_PATH: ".claude/CLAUDE.md",
+}
+
+_EXPECTED_CONFIG_FIELDS = frozenset(
+    {
+        "name",
+        "display_name",
+        "description",
+        "base_directory",
+        "context_file",
+        "command_files",
+        "agent_files",
+    }
+)
 
-class TestPydanticValidationBehavior:
-    """Test specific Pydantic validation behaviors."""
+_EXPECTED_ERR_FIELDS = frozenset(
+    {
+        ("name",),
+        ("display_name",),
+        ("description",),
+        ("base_directory",),
+        ("context_file", "file"),
+        ("command_files", "directory"),
+        ("agent_files", "directory"),
+    }
+)
 
-    def test_field_validation_order(self) -> None:
-        """Test that field validations happen in correct order."""
-        # Test that regex validation happens before custom validators
-        with pytest.raises(ValidationError) as exc_info:
-            AssistantConfig(
-                name="Invalid Name",  # Should fail regex first
-                display_name="Test",
-                description="Test description",
-                base_directory=".test",
-                context_file=ContextFileConfig(
-                    file=".different/context.md",  # Would fail path validation
-                    file_format=FileFormat.MARKDOWN,
-                ),
-                command_files=TemplateConfig(
-                    directory=".test/commands", file_format=FileFormat.MARKDOWN
-                ),
-                agent_files=TemplateConfig(
-                    directory=".test/agents", file_format=FileFormat.MARKDOWN
-                ),
-            )
+# Nested configs are frozen, so one instance can be shared by every test
+_TEST_CTX = ContextFileConfig(file=".test/context.md", file_format=_MD)
+_TEST_CMDS = TemplateConfig(directory=".test/commands", file_format=_MD)
+_TEST_AGENTS = TemplateConfig(directory=".test/agents", file_format=_MD)
+
+# Unicode edge-case strings
+_UNICODE_DISPLAY: Final = "Test Αssistant 🤖"  # Unicode and emoji
+_UNICODE_DESC: Final = "Tést description with spéciål characters"
+_BAD_UNICODE_NAME: Final = "tést"
+
+_MISSING = object()
+
+_INVALID_CASES = [
+    # Regex validation fails before the path-under-base model validator runs
+    pytest.param(
+        {
+            "name": "Invalid Name",
+            "context_file": {"file": ".different/context.md", "file_format": "md"},
+        },
+        ("name",),
+        "string_pattern_mismatch",
+        id="name-pattern",
+    ),
+    # Path validators do not run when base_directory is missing
+    pytest.param(
+        {"base_directory": _MISSING},
+        ("base_directory",),
+        "missing",
+        id="base-directory-missing",
+    ),
+    pytest.param(
+        {"base_directory": 123},
+        ("base_directory",),
+        "string_type",
+        id="base-directory-type",
+    ),
+    pytest.param(
+        {"display_name": None}, ("display_name",), "string_type", id="display-name-type"
+    ),
+    pytest.param(
+        {"extra_field": "not allowed"},
+        ("extra_field",),
+        "extra_forbidden",
+        id="extra-field",
+    ),
+]
+
+_BASE_KWARGS: dict[str, Any] = {
+    "name": "test",
+    "display_name": "Test",
+    "description": "Test description",
+    "base_directory": ".test",
+    "context_file": _TEST_CTX,
+    "command_files": _TEST_CMDS,
+    "agent_files": _TEST_AGENTS,
+}
 
-        # Should get regex error for name, not path validation error
-        errors = exc_info.value.errors()
-        name_errors = [err for err in errors if err["loc"] == ("name",)]
-        assert len(name_errors) > 0
-        assert (
-            "pattern" in str(name_errors[0]["type"]).lower()
-            or "string does not match regex" in str(name_errors[0]["msg"]).lower()
-        )
 
-    def test_validator_with_missing_dependencies(self) -> None:
-        """Test validators when dependent fields are missing."""
-        # When base_directory is missing, path validators should not run
+class TestPydanticValidationBehavior:
+    """Test specific Pydantic validation behaviors."""
+
+    @pytest.mark.parametrize("overrides, loc, err_type", _INVALID_CASES)
+    def test_invalid_field(
+        self,
+        overrides: dict,
+        loc: tuple,
+        err_type: str,
+        claude_payload: dict[str, Any],
+        index_errors: Callable[[ValidationError], dict],
+    ) -> None:
+        """Test that each invalid field reports its own error type."""
+        payload = {
+            k: v
+            for k, v in {**claude_payload, **overrides}.items()
+            if v is not _MISSING
+        }
         with pytest.raises(ValidationError) as exc_info:
-            AssistantConfig(  # type: ignore - this is expected to fail
-                name="test",
-                display_name="Test",
-                description="Test description",
-                context_file=ContextFileConfig(
-                    file=".test/context.md", file_format=FileFormat.MARKDOWN
-                ),
-                command_files=TemplateConfig(
-                    directory=".test/commands", file_format=FileFormat.MARKDOWN
-                ),
-                agent_files=TemplateConfig(
-                    directory=".test/agents", file_format=FileFormat.MARKDOWN
-                ),
-            )
+            AssistantConfig.model_validate(payload)
 
-        # Should get missing field error, not path validation error
-        errors = exc_info.value.errors()
-        base_dir_errors = [err for err in errors if err["loc"] == ("base_directory",)]
-        assert len(base_dir_errors) > 0
-        assert "missing" in base_dir_errors[0]["type"]
+        errors_at_loc = index_errors(exc_info.value).get(loc, [])
+        assert any(e["type"] == err_type for e in errors_at_loc)
 
-    def test_frozen_model_behavior(self) -> None:
+    def test_frozen_model_behavior(self, claude_config: AssistantConfig) -> None:
         """Test that frozen=True prevents all modifications."""
-        config = AssistantConfig(
-            name="claude",
-            display_name="Claude Code",
-            description="Test description",
-            base_directory=".claude",
-            context_file=ContextFileConfig(
-                file=".claude/CLAUDE.md", file_format=FileFormat.MARKDOWN
-            ),
-            command_files=TemplateConfig(
-                directory=".claude/commands", file_format=FileFormat.MARKDOWN
-            ),
-            agent_files=TemplateConfig(
-                directory=".claude/agents", file_format=FileFormat.MARKDOWN
-            ),
-        )
-
         # Verify model is frozen (prevents field modification)
-        assert config.model_config.get("frozen", False), "Model should be frozen"
-
-    def test_extra_fields_forbidden_behavior(self) -> None:
-        """Test extra='forbid' behavior in detail."""
-        data = {
-            "name": "test",
-            "display_name": "Test",
-            "description": "Test description",
-            "base_directory": ".test",
-            "context_file": {"file": ".test/context.md", "file_format": "md"},
-            "command_files": {"directory": ".test/commands", "file_format": "md"},
-            "agent_files": {"directory": ".test/agents", "file_format": "md"},
-            "extra_field": "not allowed",
-        }
-        # Extra fields in constructor should fail
-        with pytest.raises(ValidationError) as exc_info:
-            AssistantConfig.model_validate(data)
-
-        errors = exc_info.value.errors()
-        extra_errors = [err for err in errors if "extra_field" in str(err["loc"])]
-        assert len(extra_errors) > 0
-        assert (
-            "extra" in str(extra_errors[0]["msg"]).lower()
-            and "not permitted" in str(extra_errors[0]["msg"]).lower()
-        )
+        assert claude_config.model_config.get("frozen", False), "Model should be frozen"
+        with pytest.raises(ValidationError):
+            claude_config.name = "modified"  # type: ignore[misc]
 
-    def test_validation_error_details(self) -> None:
+    def test_validation_error_details(
+        self, index_errors: Callable[[ValidationError], dict]
+    ) -> None:
         """Test that validation errors provide detailed information."""
+        # Nested configs are passed as data so every field is reported in one pass
         with pytest.raises(ValidationError) as exc_info:
-            AssistantConfig(
-                name="",  # Too short
-                display_name="",  # Too short
-                description="",  # Too short
-                base_directory="invalid",  # Wrong regex
-                context_file=ContextFileConfig(
-                    file="",  # Too short
-                    file_format=FileFormat.MARKDOWN,
-                ),
-                command_files=TemplateConfig(
-                    directory="",  # Too short
-                    file_format=FileFormat.MARKDOWN,
-                ),
-                agent_files=TemplateConfig(
-                    directory="",  # Too short
-                    file_format=FileFormat.MARKDOWN,
-                ),
+            AssistantConfig.model_validate(
+                {
+                    "name": "",  # Too short
+                    "display_name": "",  # Too short
+                    "description": "",  # Too short
+                    "base_directory": "invalid",  # Wrong regex
+                    "context_file": {"file": "", "file_format": "md"},  # Too short
+                    "command_files": {"directory": "", "file_format": "md"},
+                    "agent_files": {"directory": "", "file_format": "md"},
+                }
             )
 
-        errors = exc_info.value.errors()
-
-        # Should have errors for multiple fields
-        error_fields = {tuple(err["loc"]) for err in errors}
-
-        # Check that we have at least some validation errors
-        assert len(errors) > 0, "Expected validation errors but got none"
-
-        # We expect errors from the nested structure validation
-        # The empty strings will trigger validation at the lowest level first
-        assert len(error_fields) > 0, "Expected field-level validation errors"
+        error_fields = frozenset(index_errors(exc_info.value))
+        missing = _EXPECTED_ERR_FIELDS - error_fields
+        assert not missing, f"missing validation errors for: {missing}"
 
-    def test_json_schema_generation(self) -> None:
+    def test_json_schema_generation(self, assistant_json_schema: dict) -> None:
         """Test that JSON schema is properly generated."""
-        schema = AssistantConfig.model_json_schema()
+        schema = assistant_json_schema
 
         assert schema["type"] == "object"
         assert "properties" in schema
         assert "required" in schema
 
         # All fields should be in properties
-        expected_fields = {
-            "name",
-            "display_name",
-            "description",
-            "base_directory",
-            "context_file",
-            "command_files",
-            "agent_files",
-        }
-        assert set(schema["properties"].keys()) == expected_fields
+        assert schema["properties"].keys() == _EXPECTED_CONFIG_FIELDS
 
         # Required fields (agent_files is Optional)
-        required_fields = {
-            "name",
-            "display_name",
-            "description",
-            "base_directory",
-            "context_file",
-            "command_files",
-        }
-        assert set(schema["required"]) == required_fields
+        assert set(schema["required"]) == _EXPECTED_CONFIG_FIELDS - {"agent_files"}
 
         # Check specific field constraints
         name_schema = schema["properties"]["name"]
         assert name_schema["type"] == "string"
         assert name_schema["minLength"] == 1
         assert name_schema["maxLength"] == 50
-        assert "pattern" in name_schema  # Regex should be present
+        assert name_schema["pattern"] == r"^[a-z][a-z0-9_-]*$"
 
 
 class TestInjectionPointValidation:
@@ -210,10 +207,10 @@ class TestInjectionPointValidation:
         assert isinstance(str(point), str)
         assert str(point) == "assistant_command_prefix"
         # In Pydantic v2, str() may return the enum name instead of value
-        assert str(point) in [
+        assert str(point) in (
             "assistant_command_prefix",
             "InjectionPoint.COMMAND_PREFIX",
-        ]
+        )
         assert repr(point).startswith("<InjectionPoint")
 
         # Should work in string operations
@@ -224,16 +221,14 @@ class TestInjectionPointValidation:
     def test_injection_point_enum_membership(self) -> None:
         """Test enum membership and iteration."""
         # Test iteration
-        all_points = list(InjectionPoint.get_members().values())
-        assert len(all_points) == 15
+        assert len(_MEMBERS) == 15
 
         # Test membership
         assert InjectionPoint.COMMAND_PREFIX in InjectionPoint
 
         # Test set operations
-        point_set = set(InjectionPoint.get_members().values())
-        assert len(point_set) == 15
-        assert InjectionPoint.COMMAND_PREFIX in point_set
+        assert len(_MEMBER_SET) == 15
+        assert InjectionPoint.COMMAND_PREFIX in _MEMBER_SET
 
     def test_injection_point_comparison(self) -> None:
         """Test comparison operations with InjectionPoint."""
@@ -258,212 +253,140 @@ class TestInjectionPointValidation:
         assert isinstance(ALL_INJECTION_POINTS, set)
 
         # Check that all elements are InjectionPoint instances
-        from specify_cli.assistants.injection_points import InjectionPointMeta
+        assert all(isinstance(p, InjectionPointMeta) for p in ALL_INJECTION_POINTS)
 
-        for point in REQUIRED_INJECTION_POINTS:
-            assert isinstance(point, InjectionPointMeta)
-
-        for point in OPTIONAL_INJECTION_POINTS:
-            assert isinstance(point, InjectionPointMeta)
-
-        # Check relationships
-        assert REQUIRED_INJECTION_POINTS.issubset(ALL_INJECTION_POINTS)
-        assert OPTIONAL_INJECTION_POINTS.issubset(ALL_INJECTION_POINTS)
-        assert (
-            REQUIRED_INJECTION_POINTS.union(OPTIONAL_INJECTION_POINTS)
-            == ALL_INJECTION_POINTS
-        )
-        assert (
-            REQUIRED_INJECTION_POINTS.intersection(OPTIONAL_INJECTION_POINTS) == set()
-        )
+        # Required and optional partition the full set
+        assert REQUIRED_INJECTION_POINTS.isdisjoint(OPTIONAL_INJECTION_POINTS)
+        assert _UNION == ALL_INJECTION_POINTS
 
     def test_injection_values_type_alias(self) -> None:
         """Test InjectionValues type alias behavior."""
         # Should be Dict[InjectionPoint, str]
-        injection_values: InjectionValues = {
-            InjectionPoint.COMMAND_PREFIX: "claude:",
-            InjectionPoint.SETUP_INSTRUCTIONS: "Setup Claude",
-            InjectionPoint.CONTEXT_FILE_PATH: ".claude/CLAUDE.md",
-        }
-
-        assert isinstance(injection_values, dict)
-
-        for key, value in injection_values.items():
-            assert isinstance(key, InjectionPointMeta)
-            assert isinstance(value, str)
+        assert isinstance(_SAMPLE_INJECTIONS, dict)
+        assert all(
+            isinstance(key, InjectionPointMeta) and isinstance(value, str)
+            for key, value in _SAMPLE_INJECTIONS.items()
+        )
 
 
 class TestAssistantConfigEdgeCases:
     """Test edge cases and boundary conditions for AssistantConfig."""
 
-    def test_path_validation_edge_cases(self) -> None:
-        """Test edge cases in path validation."""
-        # Test with relative path components
-        config = AssistantConfig(
-            name="test",
-            display_name="Test",
-            description="Test description",
-            base_directory=".test",
-            context_file=ContextFileConfig(
-                file=".test/../.test/context.md",  # Should normalize but still be valid
-                file_format=FileFormat.MARKDOWN,
+    @pytest.mark.parametrize(
+        "overrides, expected",
+        [
+            pytest.param(
+                # Relative path components should be kept as written
+                {
+                    "context_file": ContextFileConfig(
+                        file=".test/../.test/context.md",
+                        file_format=_MD,
+                    )
+                },
+                {"context_file.file": ".test/../.test/context.md"},
+                id="relative-components",
             ),
-            command_files=TemplateConfig(
-                directory=".test/commands", file_format=FileFormat.MARKDOWN
+            pytest.param(
+                {
+                    "command_files": TemplateConfig(
+                        directory=".test/commands/", file_format=_MD
+                    ),
+                    "agent_files": TemplateConfig(
+                        directory=".test/agents/", file_format=_MD
+                    ),
+                },
+                {"command_files.directory": ".test/commands/"},
+                id="trailing-slashes",
             ),
-            agent_files=TemplateConfig(
-                directory=".test/agents", file_format=FileFormat.MARKDOWN
-            ),
-        )
-        assert config.context_file.file == ".test/../.test/context.md"
-
-        # Test with trailing slashes
-        config = AssistantConfig(
-            name="test",
-            display_name="Test",
-            description="Test description",
-            base_directory=".test",
-            context_file=ContextFileConfig(
-                file=".test/context.md", file_format=FileFormat.MARKDOWN
-            ),
-            command_files=TemplateConfig(
-                directory=".test/commands/",  # Trailing slash
-                file_format=FileFormat.MARKDOWN,
-            ),
-            agent_files=TemplateConfig(
-                directory=".test/agents/",  # Trailing slash
-                file_format=FileFormat.MARKDOWN,
-            ),
-        )
-        assert config.command_files.directory == ".test/commands/"
-
-    def test_unicode_and_special_characters(self) -> None:
+        ],
+    )
+    def test_path_validation_edge_cases(self, overrides: dict, expected: dict) -> None:
+        """Test edge cases in path validation."""
+        config = AssistantConfig(**{**_BASE_KWARGS, **overrides})
+        for attr, value in expected.items():
+            assert attrgetter(attr)(config) == value
+
+    @pytest.mark.parametrize(
+        "name, should_raise",
+        [
+            ("test", False),
+            # Unicode not allowed in name (regex restriction)
+            (_BAD_UNICODE_NAME, True),
+        ],
+    )
+    def test_unicode_and_special_characters(
+        self, name: str, should_raise: bool
+    ) -> None:
         """Test handling of unicode and special characters."""
         # Unicode in display name and description should work
-        config = AssistantConfig(
-            name="test",
-            display_name="Test Αssistant 🤖",  # Unicode and emoji
-            description="Tést description with spéciål characters",
-            base_directory=".test",
-            context_file=ContextFileConfig(
-                file=".test/context.md", file_format=FileFormat.MARKDOWN
-            ),
-            command_files=TemplateConfig(
-                directory=".test/commands", file_format=FileFormat.MARKDOWN
-            ),
-            agent_files=TemplateConfig(
-                directory=".test/agents", file_format=FileFormat.MARKDOWN
-            ),
-        )
-        assert "🤖" in config.display_name
-        assert "spéciål" in config.description
-
-        # Unicode in name should fail (regex restriction)
-        with pytest.raises(ValidationError):
-            AssistantConfig(
-                name="tést",  # Unicode not allowed in name
-                display_name="Test",
-                description="Test description",
-                base_directory=".test",
-                context_file=ContextFileConfig(
-                    file=".test/context.md", file_format=FileFormat.MARKDOWN
-                ),
-                command_files=TemplateConfig(
-                    directory=".test/commands", file_format=FileFormat.MARKDOWN
-                ),
-                agent_files=TemplateConfig(
-                    directory=".test/agents", file_format=FileFormat.MARKDOWN
-                ),
+        expectation = pytest.raises(ValidationError) if should_raise else nullcontext()
+        with expectation:
+            config = AssistantConfig(
+                **{
+                    **_BASE_KWARGS,
+                    "name": name,
+                    "display_name": _UNICODE_DISPLAY,
+                    "description": _UNICODE_DESC,
+                }
             )
+        if not should_raise:
+            assert "🤖" in config.display_name
+            assert "spéciål" in config.description
 
-    def test_path_case_sensitivity(self) -> None:
+    def test_path_case_sensitivity(self, claude_payload: dict[str, Any]) -> None:
         """Test path case sensitivity handling."""
-        # Case should be preserved (using lowercase to pass validation)
-        config = AssistantConfig(
-            name="test",
-            display_name="Test",
-            description="Test description",
-            base_directory=".test",  # Use lowercase to pass regex validation
-            context_file=ContextFileConfig(
-                file=".test/CONTEXT.md",  # Mixed case in file path is OK
-                file_format=FileFormat.MARKDOWN,
-            ),
-            command_files=TemplateConfig(
-                directory=".test/Commands",  # Mixed case in directory path is OK
-                file_format=FileFormat.MARKDOWN,
-            ),
-            agent_files=TemplateConfig(
-                directory=".test/Agents", file_format=FileFormat.MARKDOWN
-            ),
-        )
-        assert config.base_directory == ".test"
-        assert config.context_file.file == ".test/CONTEXT.md"
-
-    def test_minimum_and_maximum_lengths(self) -> None:
-        """Test exact minimum and maximum length boundaries."""
-        # Test minimum lengths (should work)
-        config = AssistantConfig(
-            name="a",  # 1 char (minimum)
-            display_name="A",  # 1 char (minimum)
-            description="A",  # 1 char (minimum)
-            base_directory=".a",
-            context_file=ContextFileConfig(
-                file=".a/c",  # Minimum length
-                file_format=FileFormat.MARKDOWN,
-            ),
-            command_files=TemplateConfig(
-                directory=".a/d",  # Minimum length
-                file_format=FileFormat.MARKDOWN,
-            ),
-            agent_files=TemplateConfig(
-                directory=".a/m",  # Minimum length
-                file_format=FileFormat.MARKDOWN,
-            ),
+        # Case should be preserved (lowercase base_directory passes regex validation)
+        config = AssistantConfig.model_validate(
+            {
+                **claude_payload,
+                # Mixed case in file and directory paths is OK
+                "context_file": {"file": ".claude/CONTEXT.md", "file_format": "md"},
+                "command_files": {"directory": ".claude/Commands", "file_format": "md"},
+                "agent_files": {"directory": ".claude/Agents", "file_format": "md"},
+            }
         )
-        assert config.name == "a"
-
-        # Test maximum lengths (should work)
-        config = AssistantConfig(
-            name="a" * 50,  # 50 chars (maximum)
-            display_name="A" * 100,  # 100 chars (maximum)
-            description="D" * 200,  # 200 chars (maximum)
-            base_directory=".test",
-            context_file=ContextFileConfig(
-                file=".test/context.md", file_format=FileFormat.MARKDOWN
-            ),
-            command_files=TemplateConfig(
-                directory=".test/commands", file_format=FileFormat.MARKDOWN
+        assert config.base_directory == ".claude"
+        assert config.context_file.file == ".claude/CONTEXT.md"
+
+    @pytest.mark.parametrize(
+        "overrides, expected",
+        [
+            pytest.param(
+                {
+                    "name": "a",
+                    "display_name": "A",
+                    "description": "A",
+                    "base_directory": ".a",
+                    "context_file": ContextFileConfig(file=".a/c", file_format=_MD),
+                    "command_files": TemplateConfig(directory=".a/d", file_format=_MD),
+                    "agent_files": TemplateConfig(directory=".a/m", file_format=_MD),
+                },
+                {"name": "a"},
+                id="minimum",
             ),
-            agent_files=TemplateConfig(
-                directory=".test/agents", file_format=FileFormat.MARKDOWN
+            pytest.param(
+                {
+                    "name": "a" * 50,
+                    "display_name": "A" * 100,
+                    "description": "D" * 200,
+                },
+                {"name": "a" * 50, "display_name": "A" * 100, "description": "D" * 200},
+                id="maximum",
             ),
-        )
-        assert len(config.name) == 50
-        assert len(config.display_name) == 100
-        assert len(config.description) == 200
+        ],
+    )
+    def test_minimum_and_maximum_lengths(self, overrides: dict, expected: dict) -> None:
+        """Test exact minimum and maximum length boundaries."""
+        config = AssistantConfig(**{**_BASE_KWARGS, **overrides})
+        for attr, value in expected.items():
+            assert attrgetter(attr)(config) == value
 
-    def test_is_path_managed_edge_cases(self) -> None:
+    def test_is_path_managed_edge_cases(self, claude_config: AssistantConfig) -> None:
         """Test edge cases for is_path_managed method."""
-        config = AssistantConfig(
-            name="test",
-            display_name="Test",
-            description="Test description",
-            base_directory=".test",
-            context_file=ContextFileConfig(
-                file=".test/context.md", file_format=FileFormat.MARKDOWN
-            ),
-            command_files=TemplateConfig(
-                directory=".test/commands", file_format=FileFormat.MARKDOWN
-            ),
-            agent_files=TemplateConfig(
-                directory=".test/agents", file_format=FileFormat.MARKDOWN
-            ),
-        )
+        config = claude_config
 
         # Test with Path objects
-        from pathlib import Path
-
-        assert config.is_path_managed(str(Path(".test/context.md")))
+        assert config.is_path_managed(str(Path(".claude/commands/specify.md")))
 
         # Test with empty string
         assert not config.is_path_managed("")
@@ -473,41 +396,49 @@ class TestAssistantConfigEdgeCases:
 
         # Test with non-string types - commented out to fix type errors
         # assert not config.is_path_managed(123)
-        # assert not config.is_path_managed([".test"])
-        # assert not config.is_path_managed({".test": "value"})
+        # assert not config.is_path_managed([".claude"])
+        # assert not config.is_path_managed({".claude": "value"})
 
         # Test case sensitivity
-        if config.is_path_managed(".test"):
+        if config.is_path_managed(".claude"):
             # If platform is case-sensitive, different case should not match
             # This behavior may vary by platform
             pass
 
-    def test_get_all_paths_immutability(self) -> None:
-        """Test that get_all_paths returns immutable results."""
-        config = AssistantConfig(
-            name="test",
-            display_name="Test",
-            description="Test description",
-            base_directory=".test",
-            context_file=ContextFileConfig(
-                file=".test/context.md", file_format=FileFormat.MARKDOWN
-            ),
-            command_files=TemplateConfig(
-                directory=".test/commands", file_format=FileFormat.MARKDOWN
-            ),
-            agent_files=TemplateConfig(
-                directory=".test/agents", file_format=FileFormat.MARKDOWN
-            ),
+    def test_model_copy_variant_refreshes_paths(
+        self, claude_config: AssistantConfig
+    ) -> None:
+        """Test that a model_copy variant manages its own updated paths."""
+        config = claude_config.model_copy(
+            update={
+                "command_files": TemplateConfig(
+                    directory=".claude/cmds", file_format=_MD
+                )
+            }
         )
 
+        assert config.command_files.directory == ".claude/cmds"
+        assert ".claude/cmds" in config.get_all_paths()
+        assert ".claude/commands" not in config.get_all_paths()
+        assert ".claude/commands" in claude_config.get_all_paths()
+
+    def test_get_all_paths_immutability(self, claude_config: AssistantConfig) -> None:
+        """Test that get_all_paths returns immutable results."""
+        config = claude_config
+
         paths1 = config.get_all_paths()
         paths2 = config.get_all_paths()
 
-        # Should return equivalent sets
-        assert paths1 == paths2
+        # Should return the same cached frozen set
+        assert paths1 is paths2
+
+        # Immutability is enforced by the type rather than by copying
+        with pytest.raises(AttributeError):
+            paths1.add("extra_path")  # type: ignore[attr-defined]
+
+    def test_partial_model_construct(self) -> None:
+        """Test that model_construct accepts a partial payload without deriving paths."""
+        config = AssistantConfig.model_construct(name="x")
 
-        # But potentially different objects (implementation detail)
-        # Modifying one shouldn't affect the other or the config
-        paths1.add("extra_path")
-        paths2_after = config.get_all_paths()
-        assert "extra_path" not in paths2_after
+        assert config.name == "x"
+        assert not hasattr(config, "base_directory")
@@ -1,27 +1,46 @@
 """Test JSON schema generation from Pydantic models according to spec task T027."""
 
 import json
+from dataclasses import fields
+from statistics import median
+from time import perf_counter_ns
 
 from specify_cli.assistants.types import AssistantConfig
 from specify_cli.models.config import ProjectConfig
+from specify_cli.models.config import TemplateConfig as ProjectTemplateConfig
+
+_SCHEMA_RUNS = 20
+_SCHEMA_BUDGET_NS = 100_000_000  # 100ms, per the spec
+
+
+def _has_enum(root: object) -> bool:
+    """Check for enum definitions anywhere in a schema, stopping at the first one."""
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            if "enum" in node:
+                return True
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+    return False
 
 
 class TestJSONSchemaGeneration:
     """Test JSON schema generation features from Pydantic models."""
 
-    def test_assistant_config_json_schema_generation(self):
+    def test_assistant_config_json_schema_generation(self, assistant_json_schema):
         """Test that AssistantConfig generates valid JSON schema."""
-        schema = AssistantConfig.model_json_schema()
-
         # Basic schema structure validation
-        assert isinstance(schema, dict)
-        assert "type" in schema
-        assert schema["type"] == "object"
-        assert "properties" in schema
-        assert "required" in schema
+        assert isinstance(assistant_json_schema, dict)
+        assert "type" in assistant_json_schema
+        assert assistant_json_schema["type"] == "object"
+        assert "properties" in assistant_json_schema
+        assert "required" in assistant_json_schema
 
         # Check required fields are in schema
-        assert set(schema["required"]) >= {
+        assert set(assistant_json_schema["required"]) >= {
             "name",
             "display_name",
             "description",
@@ -29,7 +48,7 @@ class TestJSONSchemaGeneration:
         }  # At minimum these should be required
 
         # Check properties have proper types
-        properties = schema["properties"]
+        properties = assistant_json_schema["properties"]
         assert "name" in properties
         assert "display_name" in properties
         assert "description" in properties
@@ -44,10 +63,11 @@ class TestJSONSchemaGeneration:
         base_dir_schema = properties["base_directory"]
         assert base_dir_schema["type"] == "string"
 
-    def test_assistant_config_schema_includes_field_constraints(self):
+    def test_assistant_config_schema_includes_field_constraints(
+        self, assistant_json_schema
+    ):
         """Test that generated schema includes Pydantic field constraints."""
-        schema = AssistantConfig.model_json_schema()
-        properties = schema["properties"]
+        properties = assistant_json_schema["properties"]
 
         # Check that string length constraints are included
         name_schema = properties["name"]
@@ -64,26 +84,22 @@ class TestJSONSchemaGeneration:
         assert "pattern" in name_schema
         assert isinstance(name_schema["pattern"], str)
 
-    def test_schema_serialization_roundtrip(self):
+    def test_schema_serialization_roundtrip(self, assistant_json_schema):
         """Test that schemas can be serialized to JSON and back."""
-        schema = AssistantConfig.model_json_schema()
-
         # Serialize to JSON string
-        json_string = json.dumps(schema)
+        json_string = json.dumps(assistant_json_schema)
         assert isinstance(json_string, str)
         assert len(json_string) > 0
 
         # Deserialize back to dict
         deserialized = json.loads(json_string)
-        assert deserialized == schema
+        assert deserialized == assistant_json_schema
 
     def test_project_config_json_schema_generation(self):
         """Test that ProjectConfig works with standard Python types."""
         # ProjectConfig is a dataclass, not a Pydantic model
         # Test that we can create one and it has the expected fields
-        from specify_cli.models.config import TemplateConfig
-
-        template_config = TemplateConfig(ai_assistants=["claude", "gemini"])
+        template_config = ProjectTemplateConfig(ai_assistants=["claude", "gemini"])
         project_config = ProjectConfig(
             name="test-project", template_settings=template_config
         )
@@ -91,29 +107,26 @@ class TestJSONSchemaGeneration:
         # Should include project-specific fields (actual API)
         expected_fields = {"name", "branch_naming", "template_settings", "created_at"}
 
-        # Check that all expected fields exist on the instance
-        for field in expected_fields:
-            assert hasattr(project_config, field), (
-                f"ProjectConfig missing field: {field}"
-            )
+        # Check that all expected fields are declared on the dataclass
+        actual_fields = {field.name for field in fields(project_config)}
+        assert expected_fields <= actual_fields, (
+            f"ProjectConfig missing fields: {expected_fields - actual_fields}"
+        )
 
-    def test_schema_title_and_description(self):
+    def test_schema_title_and_description(self, assistant_json_schema):
         """Test that schemas include proper titles and descriptions."""
-        schema = AssistantConfig.model_json_schema()
-
         # Schema should have a title
-        if "title" in schema:
-            assert isinstance(schema["title"], str)
-            assert len(schema["title"]) > 0
+        if "title" in assistant_json_schema:
+            assert isinstance(assistant_json_schema["title"], str)
+            assert len(assistant_json_schema["title"]) > 0
 
         # Schema may have a description
-        if "description" in schema:
-            assert isinstance(schema["description"], str)
+        if "description" in assistant_json_schema:
+            assert isinstance(assistant_json_schema["description"], str)
 
-    def test_schema_field_descriptions(self):
+    def test_schema_field_descriptions(self, assistant_json_schema):
         """Test that schema fields include helpful descriptions."""
-        schema = AssistantConfig.model_json_schema()
-        properties = schema["properties"]
+        properties = assistant_json_schema["properties"]
 
         # Check if any field has a description
         has_descriptions = any(
@@ -127,22 +140,20 @@ class TestJSONSchemaGeneration:
                     assert isinstance(field_schema["description"], str)
                     assert len(field_schema["description"]) > 0
 
-    def test_schema_additional_properties_handling(self):
+    def test_schema_additional_properties_handling(self, assistant_json_schema):
         """Test that schema properly handles additional properties."""
-        schema = AssistantConfig.model_json_schema()
-
         # Pydantic models with frozen=True should not allow additional properties
-        if "additionalProperties" in schema:
+        if "additionalProperties" in assistant_json_schema:
             # Should be False for strict validation
-            assert schema["additionalProperties"] is False
+            assert assistant_json_schema["additionalProperties"] is False
 
-    def test_schema_nested_objects_generation(self):
+    def test_schema_nested_objects_generation(self, assistant_json_schema):
         """Test schema generation for models with nested objects."""
-        schema = AssistantConfig.model_json_schema()
-
         # AssistantConfig has nested ContextFileConfig and TemplateConfig objects
-        if "$defs" in schema or "definitions" in schema:
-            definitions = schema.get("$defs", schema.get("definitions", {}))
+        if "$defs" in assistant_json_schema or "definitions" in assistant_json_schema:
+            definitions = assistant_json_schema.get(
+                "$defs", assistant_json_schema.get("definitions", {})
+            )
             assert isinstance(definitions, dict)
 
             # Each definition should be a valid schema
@@ -151,58 +162,40 @@ class TestJSONSchemaGeneration:
                 assert "type" in definition
 
         # Check that nested objects are referenced in properties
-        properties = schema["properties"]
+        properties = assistant_json_schema["properties"]
         if "context_file" in properties:
             context_file_schema = properties["context_file"]
             # Should either have type object or reference a definition
             assert "type" in context_file_schema or "$ref" in context_file_schema
 
-    def test_schema_enum_handling(self):
+    def test_schema_enum_handling(self, assistant_json_schema):
         """Test that enums are properly represented in schemas."""
-        schema = AssistantConfig.model_json_schema()
-
-        def check_enum_in_schema(schema_part):
-            """Recursively check for enum definitions in schema."""
-            if isinstance(schema_part, dict):
-                if "enum" in schema_part:
-                    return True
-                for value in schema_part.values():
-                    if check_enum_in_schema(value):
-                        return True
-            elif isinstance(schema_part, list):
-                for item in schema_part:
-                    if check_enum_in_schema(item):
-                        return True
-            return False
-
         # FileFormat enum should be included in schemas
-        has_enums = check_enum_in_schema(schema)
-        if has_enums:
-            # This is good - enums should be included in schemas
-            assert True
+        assert _has_enum(assistant_json_schema)
 
     def test_schema_generation_performance(self):
         """Test that schema generation completes in reasonable time."""
-        import time
-
-        start_time = time.time()
+        # Warm up once so the gate measures schema building, not first-call setup
         schema = AssistantConfig.model_json_schema()
-        end_time = time.time()
-
-        generation_time = end_time - start_time
+        assert isinstance(schema, dict)
 
-        # Schema generation should be fast (under 100ms as per spec)
-        assert generation_time < 0.1, (
-            f"Schema generation took {generation_time:.3f}s, should be under 0.1s"
+        timings_ns = []
+        for _ in range(_SCHEMA_RUNS):
+            start_ns = perf_counter_ns()
+            AssistantConfig.model_json_schema()
+            timings_ns.append(perf_counter_ns() - start_ns)
+        median_ns = median(timings_ns)
+
+        # Median of several runs keeps one slow sample on a loaded runner
+        # from failing the 100ms spec budget
+        assert median_ns < _SCHEMA_BUDGET_NS, (
+            f"Schema generation took {median_ns / 1e6:.3f}ms, should be under 100ms"
         )
-        assert isinstance(schema, dict)
 
-    def test_schema_validation_with_example_data(self):
+    def test_schema_validation_with_example_data(self, assistant_json_schema):
         """Test that schema structure matches example data."""
-        schema = AssistantConfig.model_json_schema()
-
         # The schema should describe AssistantConfig structure
-        properties = schema["properties"]
+        properties = assistant_json_schema["properties"]
 
         # Validate that all main fields are described
         main_fields = ["name", "display_name", "description", "base_directory"]
@@ -216,10 +209,9 @@ class TestJSONSchemaGeneration:
             context_schema = properties["context_file"]
             assert "type" in context_schema or "$ref" in context_schema
 
-    def test_schema_field_patterns_and_constraints(self):
+    def test_schema_field_patterns_and_constraints(self, assistant_json_schema):
         """Test that schema includes field patterns and constraints."""
-        schema = AssistantConfig.model_json_schema()
-        properties = schema["properties"]
+        properties = assistant_json_schema["properties"]
 
         # Name field should have pattern constraint
         name_schema = properties["name"]
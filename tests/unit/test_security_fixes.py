@@ -1,6 +1,5 @@
 """Tests for security fixes in template rendering."""
 
-from pathlib import Path
 from unittest.mock import Mock
 
 import pytest
@@ -18,6 +17,80 @@ from specify_cli.utils.security import (
     TemplateSecurityValidator,
 )
 
+_DANGEROUS_INJECTIONS = (
+    "{{ malicious_code }}",
+    "{% for item in items %}",
+    "<script>alert('xss')</script>",
+    "__import__('os').system('rm -rf /')",
+    "javascript:alert(1)",
+)
+
+_DANGEROUS_FILENAMES = (
+    "../../../etc/passwd",
+    "file.txt;rm -rf /",
+    "template.md\\..\\..\\system32",
+    "~/.ssh/id_rsa",
+    "$HOME/.bashrc",
+)
+
+# Compiled once; jinja2 templates are safe to render repeatedly
+_HELLO_TEMPLATE = Template("Hello {{ name }}!")
+
+
+@pytest.fixture
+def safe_mock_context():
+    """Mock context with safe values, fresh per test so call history cannot leak."""
+    context = Mock(spec=TemplateContext)
+    context.project_name = "test-project"
+    context.ai_assistant = "claude"
+    context.creation_date = "2025-09-29"
+    context.author = "test-author"
+    context.to_dict = Mock(
+        return_value={
+            "name": "World",
+            "project_name": "test-project",
+            "ai_assistant": "claude",
+            "creation_date": "2025-09-29",
+        }
+    )
+    return context
+
+
+@pytest.fixture(scope="session")
+def dangerous_real_context():
+    """Real context whose template variables trip security validation."""
+    return TemplateContext(
+        project_name="test-project",
+        ai_assistant="claude",
+        template_variables={"name": "{{ malicious_code }}"},
+    )
+
+
+@pytest.fixture
+def safe_base(tmp_path):
+    """Existing base directory, since validate_safe_path resolves real paths."""
+    base = tmp_path / "safe"
+    base.mkdir()
+    return base
+
+
+@pytest.fixture(scope="class")
+def renderer():
+    """Template renderer shared by the tests of a class."""
+    return TemplateRenderer()
+
+
+@pytest.fixture(scope="class")
+def processor():
+    """Template context processor shared by the tests of a class."""
+    return TemplateContextProcessor()
+
+
+@pytest.fixture(scope="class")
+def validator():
+    """Template security validator shared by the tests of a class."""
+    return TemplateSecurityValidator()
+
 
 class TestTemplateSanitizer:
     """Test template input sanitization."""
@@ -28,22 +101,16 @@ class TestTemplateSanitizer:
         result = TemplateSanitizer.sanitize_injection_value(safe_value)
         assert result == safe_value
 
-    def test_sanitize_dangerous_injection_value(self):
+    @pytest.mark.parametrize("dangerous_value", _DANGEROUS_INJECTIONS)
+    def test_sanitize_dangerous_injection_value(self, dangerous_value):
         """Test sanitization rejects dangerous injection values."""
-        dangerous_values = [
-            "{{ malicious_code }}",
-            "{% for item in items %}",
-            "<script>alert('xss')</script>",
-            "__import__('os').system('rm -rf /')",
-            "javascript:alert(1)",
-        ]
-
-        for dangerous_value in dangerous_values:
-            with pytest.raises(TemplateSecurityError):
-                TemplateSanitizer.sanitize_injection_value(dangerous_value)
-
-    def test_sanitize_injection_value_too_long(self):
+        with pytest.raises(TemplateSecurityError):
+            TemplateSanitizer.sanitize_injection_value(dangerous_value)
+
+    def test_sanitize_injection_value_too_long(self, monkeypatch):
         """Test sanitization rejects overly long values."""
+        # A small limit keeps the triggering string tiny; the check is the same
+        monkeypatch.setattr(TemplateSanitizer, "MAX_INJECTION_VALUE_LENGTH", 16)
         long_value = "a" * (TemplateSanitizer.MAX_INJECTION_VALUE_LENGTH + 1)
         with pytest.raises(TemplateSecurityError):
             TemplateSanitizer.sanitize_injection_value(long_value)
@@ -69,8 +136,9 @@ class TestTemplateSanitizer:
         with pytest.raises(TemplateSecurityError):
             TemplateSanitizer.sanitize_context_dict(dangerous_context)
 
-    def test_sanitize_context_dict_too_many_variables(self):
+    def test_sanitize_context_dict_too_many_variables(self, monkeypatch):
         """Test sanitization rejects too many variables."""
+        monkeypatch.setattr(TemplateSanitizer, "MAX_VARIABLES", 4)
         large_context = {
             f"var_{i}": f"value_{i}" for i in range(TemplateSanitizer.MAX_VARIABLES + 1)
         }
@@ -103,20 +171,25 @@ class TestTemplateSanitizer:
         # Should not raise exception
         TemplateSanitizer.validate_template_complexity(safe_template)
 
-    def test_validate_template_complexity_too_large(self):
+    def test_validate_template_complexity_too_large(self, monkeypatch):
         """Test validation rejects overly large templates."""
+        # Avoid allocating a 1MB string just to trip the length check
+        monkeypatch.setattr(TemplateSanitizer, "MAX_TEMPLATE_SIZE", 16)
         large_template = "a" * (TemplateSanitizer.MAX_TEMPLATE_SIZE + 1)
         with pytest.raises(TemplateSecurityError):
             TemplateSanitizer.validate_template_complexity(large_template)
 
-    def test_validate_template_complexity_too_many_loops(self):
+    def test_validate_template_complexity_too_many_loops(self, monkeypatch):
         """Test validation rejects templates with too many loops."""
+        # A tiny limit keeps the input and the regex scan independent of MAX_LOOPS
+        monkeypatch.setattr(TemplateSanitizer, "MAX_LOOPS", 2)
         many_loops = "{% for i in range(10) %}" * (TemplateSanitizer.MAX_LOOPS + 1)
         with pytest.raises(TemplateSecurityError):
             TemplateSanitizer.validate_template_complexity(many_loops)
 
-    def test_validate_template_complexity_too_many_includes(self):
+    def test_validate_template_complexity_too_many_includes(self, monkeypatch):
         """Test validation rejects templates with too many includes."""
+        monkeypatch.setattr(TemplateSanitizer, "MAX_INCLUDES", 2)
         many_includes = "{% include 'template.j2' %}" * (
             TemplateSanitizer.MAX_INCLUDES + 1
         )
@@ -127,16 +200,16 @@ class TestTemplateSanitizer:
 class TestPathValidator:
     """Test path validation and sanitization."""
 
-    def test_validate_safe_path(self):
+    def test_validate_safe_path(self, safe_base):
         """Test validation of safe paths."""
-        base_path = Path("/tmp/safe")
-        target_path = Path("/tmp/safe/output.txt")
+        base_path = safe_base
+        target_path = safe_base / "output.txt"
         assert PathValidator.validate_safe_path(base_path, target_path) is True
 
-    def test_validate_unsafe_path_traversal(self):
+    def test_validate_unsafe_path_traversal(self, safe_base):
         """Test rejection of path traversal attempts."""
-        base_path = Path("/tmp/safe")
-        target_path = Path("/tmp/safe/../../../etc/passwd")
+        base_path = safe_base
+        target_path = safe_base / "../../../etc/passwd"
         assert PathValidator.validate_safe_path(base_path, target_path) is False
 
     def test_sanitize_filename_safe(self):
@@ -145,19 +218,11 @@ class TestPathValidator:
         result = PathValidator.sanitize_filename(safe_filename)
         assert result == safe_filename
 
-    def test_sanitize_filename_dangerous(self):
+    @pytest.mark.parametrize("dangerous_filename", _DANGEROUS_FILENAMES)
+    def test_sanitize_filename_dangerous(self, dangerous_filename):
         """Test rejection of dangerous filenames."""
-        dangerous_filenames = [
-            "../../../etc/passwd",
-            "file.txt;rm -rf /",
-            "template.md\\..\\..\\system32",
-            "~/.ssh/id_rsa",
-            "$HOME/.bashrc",
-        ]
-
-        for dangerous_filename in dangerous_filenames:
-            with pytest.raises(TemplateSecurityError):
-                PathValidator.sanitize_filename(dangerous_filename)
+        with pytest.raises(TemplateSecurityError):
+            PathValidator.sanitize_filename(dangerous_filename)
 
     def test_sanitize_filename_too_long(self):
         """Test rejection of overly long filenames."""
@@ -169,36 +234,21 @@ class TestPathValidator:
 class TestTemplateRenderer:
     """Test template renderer security fixes."""
 
-    def test_render_template_with_safe_context(self):
+    def test_render_template_with_safe_context(self, renderer, safe_mock_context):
         """Test template rendering with safe context."""
-        renderer = TemplateRenderer()
-        template = Template("Hello {{ name }}!")
-
-        # Create mock context
-        context = Mock(spec=TemplateContext)
-        context.project_name = "test-project"
-        context.ai_assistant = "claude"
-        context.to_dict = Mock(return_value={"name": "World"})
-
-        result = renderer.render_template(template, context, "test-template")
+        result = renderer.render_template(
+            _HELLO_TEMPLATE, safe_mock_context, "test-template"
+        )
         assert result.success is True
         assert "Hello World!" in result.content
 
-    def test_render_template_with_dangerous_context(self):
+    def test_render_template_with_dangerous_context(
+        self, renderer, dangerous_real_context
+    ):
         """Test template rendering rejects dangerous context."""
-        renderer = TemplateRenderer()
-        template = Template("Hello {{ name }}!")
-
-        # Create real context with dangerous template variables
-        from specify_cli.models.project import TemplateContext
-
-        context = TemplateContext(
-            project_name="test-project",
-            ai_assistant="claude",
-            template_variables={"name": "{{ malicious_code }}"},
+        result = renderer.render_template(
+            _HELLO_TEMPLATE, dangerous_real_context, "test-template"
         )
-
-        result = renderer.render_template(template, context, "test-template")
         # Security system should gracefully handle dangerous content by using safe fallback
         assert result.success is True  # Renders successfully with safe fallback
         # But the dangerous variable should be missing/sanitized
@@ -210,39 +260,17 @@ class TestTemplateRenderer:
 class TestTemplateContextProcessor:
     """Test template context processor security fixes."""
 
-    def test_prepare_context_safe(self):
+    def test_prepare_context_safe(self, processor, safe_mock_context):
         """Test context preparation with safe values."""
-        processor = TemplateContextProcessor()
-
-        context = Mock(spec=TemplateContext)
-        context.project_name = "test-project"
-        context.ai_assistant = "claude"
-        context.to_dict = Mock(
-            return_value={
-                "project_name": "test-project",
-                "ai_assistant": "claude",
-                "creation_date": "2025-09-29",
-            }
-        )
-
-        result = processor.prepare_context(context)
+        result = processor.prepare_context(safe_mock_context)
         assert result["project_name"] == "test-project"
         assert result["ai_assistant"] == "claude"
 
-    def test_prepare_context_with_dangerous_injection(self):
+    def test_prepare_context_with_dangerous_injection(
+        self, processor, dangerous_real_context
+    ):
         """Test context preparation sanitizes dangerous injection points."""
-        processor = TemplateContextProcessor()
-
-        # Create a real context with dangerous template variables to trigger security validation
-        from specify_cli.models.project import TemplateContext
-
-        context = TemplateContext(
-            project_name="test-project",
-            ai_assistant="claude",
-            template_variables={"dangerous_var": "{{ malicious_code }}"},
-        )
-
-        result = processor.prepare_context(context)
+        result = processor.prepare_context(dangerous_real_context)
         # Should create safe fallback context when dangerous content is detected
         assert "security_warning" in result
         assert (
@@ -250,17 +278,9 @@ class TestTemplateContextProcessor:
             == "Template context was sanitized due to security validation"
         )
 
-    def test_create_safe_fallback_context(self):
+    def test_create_safe_fallback_context(self, processor, safe_mock_context):
         """Test creation of safe fallback context."""
-        processor = TemplateContextProcessor()
-
-        context = Mock(spec=TemplateContext)
-        context.project_name = "test-project"
-        context.ai_assistant = "claude"
-        context.creation_date = "2025-09-29"
-        context.author = "test-author"
-
-        result = processor._create_safe_fallback_context(context)
+        result = processor._create_safe_fallback_context(safe_mock_context)
         assert result["project_name"] == "test-project"
         assert result["ai_assistant"] == "claude"
         assert (
@@ -272,59 +292,54 @@ class TestTemplateContextProcessor:
 class TestTemplateSecurityValidator:
     """Test comprehensive security validation."""
 
-    def test_validate_template_render_safe(self):
+    def test_validate_template_render_safe(self, validator, safe_base):
         """Test validation of safe template rendering."""
-        validator = TemplateSecurityValidator()
-
         template_content = "Hello {{ name }}!"
         context_dict = {"name": "World"}
-        output_path = Path("/tmp/safe/output.txt")
-        base_path = Path("/tmp/safe")
+        output_path = safe_base / "output.txt"
+        base_path = safe_base
 
         result = validator.validate_template_render(
             template_content, context_dict, output_path, base_path
         )
         assert result["name"] == "World"
 
-    def test_validate_template_render_unsafe_path(self):
+    def test_validate_template_render_unsafe_path(self, validator, safe_base):
         """Test validation rejects unsafe output paths."""
-        validator = TemplateSecurityValidator()
-
         template_content = "Hello {{ name }}!"
         context_dict = {"name": "World"}
-        output_path = Path("/tmp/safe/../../../etc/passwd")
-        base_path = Path("/tmp/safe")
+        output_path = safe_base / "../../../etc/passwd"
+        base_path = safe_base
 
         with pytest.raises(TemplateSecurityError):
             validator.validate_template_render(
                 template_content, context_dict, output_path, base_path
             )
 
-    def test_validate_template_render_dangerous_context(self):
+    def test_validate_template_render_dangerous_context(self, validator, safe_base):
         """Test validation rejects dangerous context."""
-        validator = TemplateSecurityValidator()
-
         template_content = "Hello {{ name }}!"
         context_dict = {"name": "{{ malicious_code }}"}
-        output_path = Path("/tmp/safe/output.txt")
-        base_path = Path("/tmp/safe")
+        output_path = safe_base / "output.txt"
+        base_path = safe_base
 
         with pytest.raises(TemplateSecurityError):
             validator.validate_template_render(
                 template_content, context_dict, output_path, base_path
             )
 
-    def test_validate_template_render_complex_template(self):
+    def test_validate_template_render_complex_template(
+        self, validator, safe_base, monkeypatch
+    ):
         """Test validation rejects overly complex templates."""
-        validator = TemplateSecurityValidator()
-
         # Create template with too many loops
+        monkeypatch.setattr(TemplateSanitizer, "MAX_LOOPS", 2)
         template_content = "{% for i in range(10) %}" * (
             TemplateSanitizer.MAX_LOOPS + 1
         )
         context_dict = {"name": "World"}
-        output_path = Path("/tmp/safe/output.txt")
-        base_path = Path("/tmp/safe")
+        output_path = safe_base / "output.txt"
+        base_path = safe_base
 
         with pytest.raises(TemplateSecurityError):
             validator.validate_template_render(